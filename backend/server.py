@@ -1,13 +1,20 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header
+from fastapi.responses import Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReturnDocument
 import os
+import re
+import hashlib
+import time
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Type
 import uuid
+import orjson
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -16,7 +23,18 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    # Timestamps are stored as native BSON dates; read them back as UTC-aware
+    tz_aware=True,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '50')),
+    # Keep warm connections so requests don't pay TCP/TLS handshakes
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '10')),
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=2000,
+    # Wire compression, negotiated with the server in order of preference
+    compressors=os.environ.get('MONGO_COMPRESSORS', 'zstd,zlib'),
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
@@ -25,6 +43,20 @@ app = FastAPI()
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# In-process cache of the serialized active project/group responses, keyed by
+# "active_project"/"active_group". Entries are dropped by the handlers that
+# change which document is active; the TTL bounds drift between uvicorn
+# workers, each of which holds its own copy.
+ACTIVE_CACHE_TTL = 5.0
+_active_cache: Dict[str, Tuple[float, bytes]] = {}
+_active_cache_generation: Dict[str, int] = {}
+
+# Documents encoded per chunk when streaming list responses
+STREAM_CHUNK_DOCS = 100
+
+# Search terms that look like a requirement ID (REQ-, REQ-01, req-012, ...)
+REQ_ID_QUERY = re.compile(r"^REQ-\d*$", re.IGNORECASE)
+
 # Enums
 class RequirementStatus(str, Enum):
     draft = "Draft"
@@ -39,29 +71,39 @@ class VerificationMethod(str, Enum):
     inspection = "Inspection"
     test = "Test"
 
+# Status values in declaration order, resolved once instead of per request
+_STATUS_VALUES = tuple(status.value for status in RequirementStatus)
+
+# Default factories shared by the models below
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
 # Models
 class Project(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     description: Optional[str] = None
     is_active: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 class ProjectCreate(BaseModel):
     name: str
     description: Optional[str] = None
 
 class Group(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     description: Optional[str] = None
     project_id: str
     parent_id: Optional[str] = None
     order: int = 0
     is_active: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 class GroupCreate(BaseModel):
     name: str
@@ -71,14 +113,14 @@ class GroupCreate(BaseModel):
     order: int = 0
 
 class Chapter(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     description: Optional[str] = None
     group_id: str
     parent_id: Optional[str] = None
     order: int = 0
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 class ChapterCreate(BaseModel):
     name: str
@@ -88,7 +130,7 @@ class ChapterCreate(BaseModel):
     order: int = 0
 
 class Requirement(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     req_id: Optional[str] = None  # Auto-generated requirement ID (REQ-001, etc.)
     title: str
     text: str
@@ -98,9 +140,9 @@ class Requirement(BaseModel):
     group_id: str
     chapter_id: Optional[str] = None
     parent_ids: List[str] = []  # Many-to-many parent relationships
-    child_ids: List[str] = []   # Many-to-many child relationships
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    child_ids: List[str] = []   # Derived on read from other requirements' parent_ids
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     created_by: Optional[str] = None
     updated_by: Optional[str] = None
 
@@ -123,12 +165,16 @@ class RequirementUpdate(BaseModel):
     chapter_id: Optional[str] = None
     parent_ids: Optional[List[str]] = None
 
+class RequirementBatchUpdate(BaseModel):
+    requirement_ids: List[str]
+    update: RequirementUpdate
+
 class RequirementRelationship(BaseModel):
     parent_id: str
     child_id: str
 
 class RequirementChangeLog(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     requirement_id: str
     change_type: str  # 'created', 'updated', 'status_changed', 'relationship_added', 'relationship_removed'
     field_name: Optional[str] = None  # Which field was changed
@@ -136,32 +182,200 @@ class RequirementChangeLog(BaseModel):
     new_value: Optional[str] = None
     change_description: str
     changed_by: Optional[str] = None  # User who made the change
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 # Helper functions
-def prepare_for_mongo(data: dict) -> dict:
-    """Convert datetime objects to strings for MongoDB storage"""
-    for key, value in data.items():
-        if isinstance(value, datetime):
-            data[key] = value.isoformat()
-    return data
-
-def parse_from_mongo(item: dict) -> dict:
-    """Convert string dates back to datetime objects and remove MongoDB internal fields"""
-    if item is None:
-        return item
-
-    # Remove MongoDB's internal _id field to avoid serialization issues
-    item.pop("_id", None)
-    
-    for key in ["created_at", "updated_at"]:
-        if key in item and isinstance(item[key], str):
-            try:
-                item[key] = datetime.fromisoformat(item[key])
-            except Exception:
-                # If parsing fails, leave the value as-is
-                pass
-    return item
+def _orjson_default(value: Any) -> Any:
+    """Fallback encoder for values orjson does not handle natively"""
+    if isinstance(value, BaseModel):
+        # Read-path models are built with model_construct and may still hold
+        # raw Mongo values (plain strings for enums/dates), so skip the
+        # serializer's type-mismatch warnings.
+        return value.model_dump(warnings=False)
+    return str(value)
+
+def orjson_dumps(content: Any) -> bytes:
+    """Encode API payloads with the options shared by all orjson responses"""
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_UUID,
+    )
+
+class ORJSONResponse(Response):
+    """JSON response rendered straight from Mongo documents with orjson.
+
+    Bypasses FastAPI's response_model validation and jsonable_encoder, so
+    callers must strip ``_id`` (e.g. with a ``{"_id": 0}`` projection).
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
+
+async def stream_json_array(cursor, headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    """Stream a Motor cursor to the client as a JSON array.
+
+    The first STREAM_CHUNK_DOCS documents are fetched before the response
+    starts, so a failing query still becomes a 500 instead of a 200 with a
+    truncated body. The rest are encoded as the cursor yields them and sent
+    in chunks of STREAM_CHUNK_DOCS, roughly one Motor batch, so the result
+    set is never held in memory.
+    """
+    first_batch = await cursor.to_list(STREAM_CHUNK_DOCS)
+
+    async def body():
+        head = b"[" + b",".join(map(orjson_dumps, first_batch))
+        # A short first batch means the cursor is already exhausted
+        if len(first_batch) < STREAM_CHUNK_DOCS:
+            yield head + b"]"
+            return
+        yield head
+        chunk = []
+        async for doc in cursor:
+            chunk += (b",", orjson_dumps(doc))
+            if len(chunk) == 2 * STREAM_CHUNK_DOCS:
+                yield b"".join(chunk)
+                chunk = []
+        chunk.append(b"]")
+        yield b"".join(chunk)
+
+    return StreamingResponse(body(), media_type="application/json", headers=headers)
+
+def requirement_read_stages(projection: Dict[str, int]) -> List[dict]:
+    """Aggregation stages that apply ``projection`` and derive ``child_ids``.
+
+    Only parent_ids is stored; a requirement's children are the requirements
+    whose parent_ids contain its id, found through the parent_ids index.
+    """
+    stages: List[dict] = [{"$project": projection}]
+    # Inclusion projections (which always name "id") only get child_ids on request
+    if "child_ids" in projection or "id" not in projection:
+        stages += [
+            {"$lookup": {
+                "from": "requirements",
+                "localField": "id",
+                "foreignField": "parent_ids",
+                "pipeline": [{"$project": {"_id": 0, "id": 1}}],
+                "as": "child_ids",
+            }},
+            {"$set": {"child_ids": "$child_ids.id"}},
+        ]
+    return stages
+
+async def find_requirement(requirement_id: str) -> Optional[dict]:
+    """Fetch a single requirement document with its derived child_ids"""
+    pipeline = [{"$match": {"id": requirement_id}}, *requirement_read_stages({"_id": 0})]
+    docs = await db.requirements.aggregate(pipeline).to_list(1)
+    return docs[0] if docs else None
+
+async def touch_requirements(requirement_ids, now: datetime) -> None:
+    """Bump ``updated_at`` on requirements whose derived child_ids changed.
+
+    child_ids is computed from other documents' parent_ids, so without this
+    list ETags, which only see each document's own timestamp, would go stale.
+    """
+    if requirement_ids:
+        await db.requirements.update_many(
+            {"id": {"$in": list(requirement_ids)}},
+            {"$set": {"updated_at": now}},
+        )
+
+async def list_etag(collection, query: dict, projection: Dict[str, int]) -> str:
+    """Weak ETag for the ``projection`` of the documents matching ``query``.
+
+    Derived from the match count and the newest ``updated_at``, so it
+    changes on inserts, deletes and any write that bumps ``updated_at``.
+    The query and projection are hashed in too, so different filters or
+    ``fields`` selections never share a validator.
+    """
+    pipeline = [
+        {"$match": query},
+        {"$group": {"_id": None, "count": {"$sum": 1}, "last_updated": {"$max": "$updated_at"}}},
+    ]
+    stats = await collection.aggregate(pipeline).to_list(1)
+    version = f"{stats[0]['count']}:{stats[0]['last_updated']}:" if stats else "0::"
+    representation = orjson.dumps([query, projection], option=orjson.OPT_SORT_KEYS)
+    return f'W/"{hashlib.sha1(version.encode() + representation).hexdigest()}"'
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check an If-None-Match header against the current ETag"""
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+def list_projection(model: Type[BaseModel], fields: Optional[str] = None) -> Dict[str, int]:
+    """Build a find() projection from a comma-separated ``fields`` query param.
+
+    Without ``fields`` the full document minus ``_id`` is returned. Unknown
+    field names are ignored and ``id`` is always included.
+    """
+    if not fields:
+        return {"_id": 0}
+
+    projection = {"_id": 0, "id": 1}
+    for name in fields.split(","):
+        name = name.strip()
+        if name in model.model_fields:
+            projection[name] = 1
+    return projection
+
+async def get_cached_active(key: str, collection) -> Response:
+    """Return the active document of ``collection``, served from the cache when fresh"""
+    entry = _active_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return Response(content=entry[1], media_type="application/json")
+
+    generation = _active_cache_generation.get(key, 0)
+    doc = await collection.find_one({"is_active": True}, {"_id": 0})
+    body = orjson_dumps(doc)
+    # Don't store a result that an invalidation raced with
+    if _active_cache_generation.get(key, 0) == generation:
+        _active_cache[key] = (time.monotonic() + ACTIVE_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
+
+def invalidate_active_cache(*keys: str) -> None:
+    """Drop cached active project/group responses after they may have changed"""
+    for key in keys:
+        _active_cache.pop(key, None)
+        _active_cache_generation[key] = _active_cache_generation.get(key, 0) + 1
+
+async def next_requirement_number(project_id: str) -> int:
+    """Atomically allocate the next requirement sequence number for a project"""
+    counter = await db.counters.find_one_and_update(
+        {"_id": project_id},
+        {"$inc": {"seq": 1}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if counter is None:
+        # First allocation for this project: seed the counter from the highest
+        # existing REQ-NNN so projects created before counters keep numbering
+        seed_pipeline = [
+            {"$match": {"project_id": project_id}},
+            {"$group": {"_id": None, "max": {"$max": {"$convert": {
+                # req_id is optional; $strLenCP throws on a missing value
+                "input": {"$substrCP": [
+                    {"$ifNull": ["$req_id", ""]},
+                    4,
+                    {"$strLenCP": {"$ifNull": ["$req_id", ""]}},
+                ]},
+                "to": "int",
+                "onError": 0,
+                "onNull": 0,
+            }}}}},
+        ]
+        seed = await db.requirements.aggregate(seed_pipeline).to_list(1)
+        await db.counters.update_one(
+            {"_id": project_id},
+            {"$setOnInsert": {"seq": seed[0]["max"] if seed else 0}},
+            upsert=True,
+        )
+        counter = await db.counters.find_one_and_update(
+            {"_id": project_id},
+            {"$inc": {"seq": 1}},
+            return_document=ReturnDocument.AFTER,
+        )
+    return counter["seq"]
 
 async def create_change_log_entry(
     requirement_id: str,
@@ -183,7 +397,7 @@ async def create_change_log_entry(
         changed_by=changed_by or "System"
     )
     
-    change_log_dict = prepare_for_mongo(change_log.dict())
+    change_log_dict = change_log.model_dump()
     await db.requirement_change_logs.insert_one(change_log_dict)
 
 # Project endpoints
@@ -192,24 +406,21 @@ async def create_project(project: ProjectCreate):
     # Deactivate all other projects
     await db.projects.update_many({}, {"$set": {"is_active": False}})
     
-    project_dict = project.dict()
+    project_dict = project.model_dump()
     project_obj = Project(**project_dict, is_active=True)
-    project_dict = prepare_for_mongo(project_obj.dict())
+    project_dict = project_obj.model_dump()
     
     await db.projects.insert_one(project_dict)
+    invalidate_active_cache("active_project")
     return project_obj
 
-@api_router.get("/projects", response_model=List[Project])
-async def get_projects():
-    projects = await db.projects.find().to_list(1000)
-    return [Project(**parse_from_mongo(project)) for project in projects]
+@api_router.get("/projects")
+async def get_projects(fields: Optional[str] = None):
+    return await stream_json_array(db.projects.find({}, list_projection(Project, fields)))
 
-@api_router.get("/projects/active", response_model=Optional[Project])
+@api_router.get("/projects/active")
 async def get_active_project():
-    project = await db.projects.find_one({"is_active": True})
-    if project:
-        return Project(**parse_from_mongo(project))
-    return None
+    return await get_cached_active("active_project", db.projects)
 
 @api_router.put("/projects/{project_id}/activate")
 async def activate_project(project_id: str):
@@ -217,17 +428,24 @@ async def activate_project(project_id: str):
     await db.projects.update_many({}, {"$set": {"is_active": False}})
     # Activate selected project
     result = await db.projects.update_one({"id": project_id}, {"$set": {"is_active": True}})
+    invalidate_active_cache("active_project")
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Project not found")
     return {"message": "Project activated"}
 
 @api_router.delete("/projects/{project_id}")
 async def delete_project(project_id: str):
-    # Delete project and all related data
-    await db.projects.delete_one({"id": project_id})
-    await db.groups.delete_many({"project_id": project_id})
-    await db.chapters.delete_many({"project_id": project_id})
-    await db.requirements.delete_many({"project_id": project_id})
+    # Delete project and all related data; parents elsewhere lose children
+    parent_ids = await db.requirements.distinct("parent_ids", {"project_id": project_id})
+    await asyncio.gather(
+        db.projects.delete_one({"id": project_id}),
+        db.groups.delete_many({"project_id": project_id}),
+        db.chapters.delete_many({"project_id": project_id}),
+        db.requirements.delete_many({"project_id": project_id}),
+        db.counters.delete_one({"_id": project_id}),
+        touch_requirements(parent_ids, _utcnow()),
+    )
+    invalidate_active_cache("active_project", "active_group")
     return {"message": "Project deleted"}
 
 # Group endpoints
@@ -236,75 +454,85 @@ async def create_group(group: GroupCreate):
     # Deactivate all other groups in the project
     await db.groups.update_many({"project_id": group.project_id}, {"$set": {"is_active": False}})
     
-    group_dict = group.dict()
+    group_dict = group.model_dump()
     group_obj = Group(**group_dict, is_active=True)
-    group_dict = prepare_for_mongo(group_obj.dict())
+    group_dict = group_obj.model_dump()
     
     await db.groups.insert_one(group_dict)
+    invalidate_active_cache("active_group")
     return group_obj
 
-@api_router.get("/groups", response_model=List[Group])
-async def get_groups(project_id: Optional[str] = None):
+@api_router.get("/groups")
+async def get_groups(project_id: Optional[str] = None, fields: Optional[str] = None):
     query = {"project_id": project_id} if project_id else {}
-    groups = await db.groups.find(query).to_list(1000)
-    return [Group(**parse_from_mongo(group)) for group in groups]
+    return await stream_json_array(db.groups.find(query, list_projection(Group, fields)))
 
-@api_router.get("/groups/active", response_model=Optional[Group])
+@api_router.get("/groups/active")
 async def get_active_group():
-    group = await db.groups.find_one({"is_active": True})
-    if group:
-        return Group(**parse_from_mongo(group))
-    return None
+    return await get_cached_active("active_group", db.groups)
 
 @api_router.put("/groups/{group_id}/activate")
 async def activate_group(group_id: str):
-    group = await db.groups.find_one({"id": group_id})
+    # Activate selected group, getting back its project in the same round-trip
+    group = await db.groups.find_one_and_update(
+        {"id": group_id},
+        {"$set": {"is_active": True}},
+        projection={"_id": 0, "project_id": 1},
+    )
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
     
-    # Deactivate all groups in the same project
-    await db.groups.update_many({"project_id": group["project_id"]}, {"$set": {"is_active": False}})
-    # Activate selected group
-    await db.groups.update_one({"id": group_id}, {"$set": {"is_active": True}})
+    # Deactivate all other groups in the same project
+    await db.groups.update_many(
+        {"project_id": group["project_id"], "id": {"$ne": group_id}},
+        {"$set": {"is_active": False}},
+    )
+    invalidate_active_cache("active_group")
     return {"message": "Group activated"}
 
 @api_router.put("/groups/{group_id}/reorder")
 async def reorder_group(group_id: str, new_order: int, new_parent_id: Optional[str] = None):
-    update_data = {"order": new_order, "updated_at": datetime.now(timezone.utc).isoformat()}
+    update_data = {"order": new_order, "updated_at": _utcnow()}
     if new_parent_id is not None:
         update_data["parent_id"] = new_parent_id
     
     result = await db.groups.update_one({"id": group_id}, {"$set": update_data})
+    invalidate_active_cache("active_group")
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Group not found")
     return {"message": "Group reordered"}
 
 @api_router.delete("/groups/{group_id}")
 async def delete_group(group_id: str):
-    await db.groups.delete_one({"id": group_id})
-    await db.chapters.delete_many({"group_id": group_id})
-    await db.requirements.delete_many({"group_id": group_id})
+    # Parents in other groups lose the deleted requirements as children
+    parent_ids = await db.requirements.distinct("parent_ids", {"group_id": group_id})
+    await asyncio.gather(
+        db.groups.delete_one({"id": group_id}),
+        db.chapters.delete_many({"group_id": group_id}),
+        db.requirements.delete_many({"group_id": group_id}),
+        touch_requirements(parent_ids, _utcnow()),
+    )
+    invalidate_active_cache("active_group")
     return {"message": "Group deleted"}
 
 # Chapter endpoints
 @api_router.post("/chapters", response_model=Chapter)
 async def create_chapter(chapter: ChapterCreate):
-    chapter_dict = chapter.dict()
+    chapter_dict = chapter.model_dump()
     chapter_obj = Chapter(**chapter_dict)
-    chapter_dict = prepare_for_mongo(chapter_obj.dict())
+    chapter_dict = chapter_obj.model_dump()
     
     await db.chapters.insert_one(chapter_dict)
     return chapter_obj
 
-@api_router.get("/chapters", response_model=List[Chapter])
-async def get_chapters(group_id: Optional[str] = None):
+@api_router.get("/chapters")
+async def get_chapters(group_id: Optional[str] = None, fields: Optional[str] = None):
     query = {"group_id": group_id} if group_id else {}
-    chapters = await db.chapters.find(query).to_list(1000)
-    return [Chapter(**parse_from_mongo(chapter)) for chapter in chapters]
+    return await stream_json_array(db.chapters.find(query, list_projection(Chapter, fields)))
 
 @api_router.put("/chapters/{chapter_id}/reorder")
 async def reorder_chapter(chapter_id: str, new_order: int, new_parent_id: Optional[str] = None):
-    update_data = {"order": new_order, "updated_at": datetime.now(timezone.utc).isoformat()}
+    update_data = {"order": new_order, "updated_at": _utcnow()}
     if new_parent_id is not None:
         update_data["parent_id"] = new_parent_id
     
@@ -315,43 +543,51 @@ async def reorder_chapter(chapter_id: str, new_order: int, new_parent_id: Option
 
 @api_router.delete("/chapters/{chapter_id}")
 async def delete_chapter(chapter_id: str):
-    await db.chapters.delete_one({"id": chapter_id})
-    await db.requirements.delete_many({"chapter_id": chapter_id})
+    # Parents outside the chapter lose the deleted requirements as children
+    parent_ids = await db.requirements.distinct("parent_ids", {"chapter_id": chapter_id})
+    await asyncio.gather(
+        db.chapters.delete_one({"id": chapter_id}),
+        db.requirements.delete_many({"chapter_id": chapter_id}),
+        touch_requirements(parent_ids, _utcnow()),
+    )
     return {"message": "Chapter deleted"}
 
 # Requirement endpoints
 @api_router.post("/requirements", response_model=Requirement)
 async def create_requirement(requirement: RequirementCreate):
     # Generate requirement ID
-    project = await db.projects.find_one({"id": requirement.project_id})
+    project = await db.projects.find_one({"id": requirement.project_id}, {"_id": 1})
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Count existing requirements in project to generate ID
-    count = await db.requirements.count_documents({"project_id": requirement.project_id})
-    req_id = f"REQ-{str(count + 1).zfill(3)}"
+    req_id = f"REQ-{await next_requirement_number(requirement.project_id):03d}"
     
-    requirement_dict = requirement.dict()
+    requirement_dict = requirement.model_dump()
     requirement_obj = Requirement(**requirement_dict, req_id=req_id)
-    requirement_dict = prepare_for_mongo(requirement_obj.dict())
+    requirement_dict = requirement_obj.model_dump(exclude={"child_ids"})
     
     await db.requirements.insert_one(requirement_dict)
     
-    # Log requirement creation
-    await create_change_log_entry(
-        requirement_id=requirement_obj.id,
-        change_type="created",
-        change_description=f"Requirement {requirement_obj.req_id} created with title: {requirement_obj.title}"
+    # Log requirement creation and bump the parents that gained a child
+    await asyncio.gather(
+        create_change_log_entry(
+            requirement_id=requirement_obj.id,
+            change_type="created",
+            change_description=f"Requirement {requirement_obj.req_id} created with title: {requirement_obj.title}"
+        ),
+        touch_requirements(requirement_obj.parent_ids, requirement_obj.updated_at),
     )
     
     return requirement_obj
 
-@api_router.get("/requirements", response_model=List[Requirement])
+@api_router.get("/requirements")
 async def get_requirements(
     project_id: Optional[str] = None,
     group_id: Optional[str] = None,
     chapter_id: Optional[str] = None,
-    status: Optional[RequirementStatus] = None
+    status: Optional[RequirementStatus] = None,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
 ):
     query = {}
     if project_id:
@@ -363,13 +599,135 @@ async def get_requirements(
     if status:
         query["status"] = status
     
-    requirements = await db.requirements.find(query).to_list(1000)
-    return [Requirement(**parse_from_mongo(req)) for req in requirements]
+    projection = list_projection(Requirement, fields)
+    etag = await list_etag(db.requirements, query, projection)
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    pipeline = [{"$match": query}, *requirement_read_stages(projection)]
+    return await stream_json_array(db.requirements.aggregate(pipeline), headers={"ETag": etag})
+
+# Search endpoint
+# Registered before /requirements/{requirement_id} so "search" is not
+# captured as a requirement ID
+@api_router.get("/requirements/search")
+async def search_requirements(
+    q: str,
+    project_id: Optional[str] = None,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
+):
+    q = q.strip()
+    pipeline: List[dict] = []
+    if REQ_ID_QUERY.match(q):
+        # Requirement IDs are stored upper-case, so an anchored,
+        # case-sensitive prefix match can walk the (project_id, req_id) index
+        query = {"req_id": {"$regex": f"^{re.escape(q.upper())}"}}
+    else:
+        query = {"$text": {"$search": q}}
+        pipeline.append({"$sort": {"score": {"$meta": "textScore"}}})
+    
+    if project_id:
+        query["project_id"] = project_id
+    
+    projection = list_projection(Requirement, fields)
+    etag = await list_etag(db.requirements, query, projection)
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    pipeline = [
+        {"$match": query},
+        *pipeline,
+        {"$limit": 100},
+        *requirement_read_stages(projection),
+    ]
+    return await stream_json_array(db.requirements.aggregate(pipeline), headers={"ETag": etag})
 
-@api_router.get("/requirements/{requirement_id}", response_model=Requirement)
+@api_router.get("/requirements/{requirement_id}")
 async def get_requirement(requirement_id: str):
     """API endpoint that uses the shared service helper"""
-    return await get_requirement_by_id(requirement_id)
+    return ORJSONResponse(await get_requirement_by_id(requirement_id))
+
+
+FIELD_DISPLAY_NAMES = {
+    "title": "Title",
+    "text": "Description",
+    "status": "Status",
+    "verification_methods": "Verification Methods",
+    "group_id": "Group",
+    "chapter_id": "Chapter",
+}
+
+def diff_requirement_fields(
+    current_req: dict, fields: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Dict[str, str]]]:
+    """Compare supplied fields against a stored requirement.
+
+    Returns the ``$set`` document for the fields that actually changed and
+    the matching change records for the change log.
+    """
+    changes = []
+    update_dict: Dict[str, Any] = {}
+
+    for field, new_value in fields.items():
+        old_value = current_req.get(field)
+
+        # Convert lists to strings for comparison
+        if isinstance(old_value, list):
+            old_value_str = ", ".join(old_value) if old_value else "None"
+        else:
+            old_value_str = str(old_value) if old_value else "None"
+
+        if isinstance(new_value, list):
+            new_value_str = ", ".join(new_value) if new_value else "None"
+        else:
+            new_value_str = str(new_value)
+
+        # Check if value actually changed
+        if old_value != new_value:
+            update_dict[field] = new_value
+            changes.append(
+                {
+                    "field": field,
+                    "old_value": old_value_str,
+                    "new_value": new_value_str,
+                }
+            )
+
+    return update_dict, changes
+
+
+def field_change_log_entries(
+    requirement_id: str, changes: List[Dict[str, str]], actor: Optional[str] = None
+) -> List[dict]:
+    """Build change log documents for the given field changes"""
+    entries = []
+    for change in changes:
+        field_display = FIELD_DISPLAY_NAMES.get(
+            change["field"], change["field"].replace("_", " ").title()
+        )
+        entries.append(
+            RequirementChangeLog(
+                requirement_id=requirement_id,
+                change_type="updated",
+                field_name=change["field"],
+                old_value=change["old_value"],
+                new_value=change["new_value"],
+                change_description=(
+                    f"{field_display} changed from '"
+                    f"{change['old_value']}' to '{change['new_value']}'"
+                ),
+                changed_by=actor or "System",
+            ).model_dump()
+        )
+    return entries
+
+
+def changed_parent_ids(current_req: dict, update_dict: Dict[str, Any]) -> set:
+    """Parents added to or removed from a requirement by ``update_dict``"""
+    if "parent_ids" not in update_dict:
+        return set()
+    return set(current_req.get("parent_ids") or []) ^ set(update_dict["parent_ids"])
 
 
 async def update_requirement_with_logging(
@@ -381,145 +739,79 @@ async def update_requirement_with_logging(
 
     This helper centralizes:
     - field diffing
-    - parent/child relationship maintenance
     - change log entry creation
     """
     # Get current requirement
-    current_req = await db.requirements.find_one({"id": requirement_id})
+    current_req = await find_requirement(requirement_id)
     if not current_req:
         raise HTTPException(status_code=404, detail="Requirement not found")
 
-    # Track changes for logging
-    changes = []
-    update_dict: Dict[str, Any] = {}
-
-    for field, new_value in update_data.dict().items():
-        if new_value is not None:
-            old_value = current_req.get(field)
-
-            # Convert lists to strings for comparison
-            if isinstance(old_value, list):
-                old_value_str = ", ".join(old_value) if old_value else "None"
-            else:
-                old_value_str = str(old_value) if old_value else "None"
-
-            if isinstance(new_value, list):
-                new_value_str = ", ".join(new_value) if new_value else "None"
-            else:
-                new_value_str = str(new_value)
-
-            # Check if value actually changed
-            if old_value != new_value:
-                update_dict[field] = new_value
-                changes.append(
-                    {
-                        "field": field,
-                        "old_value": old_value_str,
-                        "new_value": new_value_str,
-                    }
-                )
+    # Only the fields the caller actually supplied
+    update_dict, changes = diff_requirement_fields(
+        current_req, update_data.model_dump(exclude_none=True)
+    )
 
     if not changes:
         # No actual changes, return current requirement as model
-        return Requirement(**parse_from_mongo(current_req))
+        return Requirement.model_construct(**current_req)
 
-    update_dict["updated_at"] = datetime.now(timezone.utc).isoformat()
+    now = update_dict["updated_at"] = _utcnow()
 
-    # Handle parent-child relationships if parent_ids changed
-    if "parent_ids" in update_dict:
-        old_parents = set(current_req.get("parent_ids", []))
-        new_parents = set(update_dict["parent_ids"])
-
-        # Remove this requirement from old parents' child_ids
-        for parent_id in old_parents - new_parents:
-            await db.requirements.update_one(
-                {"id": parent_id},
-                {"$pull": {"child_ids": requirement_id}},
-            )
-
-        # Add this requirement to new parents' child_ids
-        for parent_id in new_parents - old_parents:
-            await db.requirements.update_one(
-                {"id": parent_id},
-                {"$addToSet": {"child_ids": requirement_id}},
-            )
-
-    result = await db.requirements.update_one(
+    # Apply the update and read back the result in the same round-trip
+    updated_req = await db.requirements.find_one_and_update(
         {"id": requirement_id},
         {"$set": update_dict},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER,
     )
 
-    if result.modified_count == 0:
+    if updated_req is None:
         raise HTTPException(status_code=404, detail="Requirement not found")
 
-    # Create change log entries
-    for change in changes:
-        field_display_names = {
-            "title": "Title",
-            "text": "Description",
-            "status": "Status",
-            "verification_methods": "Verification Methods",
-            "group_id": "Group",
-            "chapter_id": "Chapter",
-        }
-
-        field_display = field_display_names.get(
-            change["field"], change["field"].replace("_", " ").title()
-        )
+    # Children point at this requirement, so its own update can't change them
+    updated_req["child_ids"] = current_req["child_ids"]
 
-        await create_change_log_entry(
-            requirement_id=requirement_id,
-            change_type="updated",
-            field_name=change["field"],
-            old_value=change["old_value"],
-            new_value=change["new_value"],
-            change_description=(
-                f"{field_display} changed from '"
-                f"{change['old_value']}' to '{change['new_value']}'"
-            ),
-            changed_by=actor or "System",
-        )
+    # Create change log entries; parents gaining or losing this child have
+    # a new child_ids
+    await asyncio.gather(
+        db.requirement_change_logs.insert_many(
+            field_change_log_entries(requirement_id, changes, actor)
+        ),
+        touch_requirements(changed_parent_ids(current_req, update_dict), now),
+    )
 
-    updated_req = await db.requirements.find_one({"id": requirement_id})
-    return Requirement(**parse_from_mongo(updated_req))
+    return Requirement.model_construct(**updated_req)
 
 
 
 async def get_requirement_by_id(requirement_id: str) -> Requirement:
     """Service helper to fetch a requirement or raise 404"""
-    requirement = await db.requirements.find_one({"id": requirement_id})
+    requirement = await find_requirement(requirement_id)
     if not requirement:
         raise HTTPException(status_code=404, detail="Requirement not found")
-    return Requirement(**parse_from_mongo(requirement))
+    return Requirement.model_construct(**requirement)
 
 
 async def delete_requirement_with_logging(requirement_id: str, actor: Optional[str] = None) -> None:
     """Delete a requirement, clean up relationships, and log deletion"""
-    # Get requirement to find relationships
-    requirement = await db.requirements.find_one({"id": requirement_id})
+    # Delete the requirement, getting back what's needed for the log entry
+    requirement = await db.requirements.find_one_and_delete(
+        {"id": requirement_id},
+        projection={"_id": 0, "req_id": 1, "title": 1, "parent_ids": 1},
+    )
     if not requirement:
         raise HTTPException(status_code=404, detail="Requirement not found")
 
-    # Remove this requirement from all parent-child relationships
-    parent_ids = requirement.get("parent_ids", [])
-    child_ids = requirement.get("child_ids", [])
-
-    # Remove from parents' child_ids
-    for parent_id in parent_ids:
-        await db.requirements.update_one(
-            {"id": parent_id},
-            {"$pull": {"child_ids": requirement_id}}
-        )
-
-    # Remove from children's parent_ids
-    for child_id in child_ids:
-        await db.requirements.update_one(
-            {"id": child_id},
-            {"$pull": {"parent_ids": requirement_id}}
-        )
-
-    # Delete the requirement document
-    await db.requirements.delete_one({"id": requirement_id})
+    # Remove this requirement from its children's parent_ids and bump its
+    # parents, whose derived child_ids just lost it
+    now = _utcnow()
+    await asyncio.gather(
+        db.requirements.update_many(
+            {"parent_ids": requirement_id},
+            {"$pull": {"parent_ids": requirement_id}, "$set": {"updated_at": now}},
+        ),
+        touch_requirements(requirement.get("parent_ids"), now),
+    )
 
     # Log deletion with basic identifying info if available
     req_id = requirement.get("req_id", requirement_id)
@@ -535,126 +827,152 @@ async def delete_requirement_with_logging(requirement_id: str, actor: Optional[s
         changed_by=actor or "System",
     )
 
-@api_router.put("/requirements/{requirement_id}", response_model=Requirement)
+# Registered before /requirements/{requirement_id} so "batch" is not
+# captured as a requirement ID
+@api_router.put("/requirements/batch")
+async def batch_update_requirements(payload: RequirementBatchUpdate):
+    """Apply the same update to several requirements.
+
+    Only fields declared on RequirementUpdate are accepted. Requirements are
+    read in one query, written with a single update_many and their change
+    log entries inserted together.
+    """
+    # Preserve order, drop duplicates
+    requirement_ids = list(dict.fromkeys(payload.requirement_ids))
+    if not requirement_ids:
+        raise HTTPException(status_code=400, detail="No requirement_ids provided")
+
+    fields = payload.update.model_dump(exclude_none=True)
+
+    current_reqs = await db.requirements.aggregate(
+        [{"$match": {"id": {"$in": requirement_ids}}},
+         *requirement_read_stages({"_id": 0})]
+    ).to_list(len(requirement_ids))
+    by_id = {req["id"]: req for req in current_reqs}
+
+    now = _utcnow()
+    changed_ids: List[str] = []
+    touched_parent_ids: set = set()
+    log_entries: List[dict] = []
+    updated: List[dict] = []
+    failed: List[str] = []
+
+    for req_id in requirement_ids:
+        current_req = by_id.get(req_id)
+        if current_req is None:
+            failed.append(req_id)
+            continue
+
+        update_dict, changes = diff_requirement_fields(current_req, fields)
+        if changes:
+            changed_ids.append(req_id)
+            touched_parent_ids |= changed_parent_ids(current_req, update_dict)
+            log_entries.extend(
+                field_change_log_entries(req_id, changes, "System(batch)")
+            )
+            current_req.update(update_dict, updated_at=now)
+        updated.append(current_req)
+
+    if changed_ids:
+        # Every changed document gets the same $set; fields that already held
+        # the new value are simply rewritten unchanged
+        await asyncio.gather(
+            db.requirements.update_many(
+                {"id": {"$in": changed_ids}},
+                {"$set": {**fields, "updated_at": now}},
+            ),
+            db.requirement_change_logs.insert_many(log_entries),
+            touch_requirements(touched_parent_ids, now),
+        )
+
+    return ORJSONResponse({
+        "updated_count": len(updated),
+        "failed_ids": failed,
+        "updated_requirements": updated,
+    })
+
+@api_router.put("/requirements/{requirement_id}")
 async def update_requirement(requirement_id: str, update_data: RequirementUpdate):
     """API endpoint that delegates to the shared update service helper."""
-    return await update_requirement_with_logging(
+    updated_req = await update_requirement_with_logging(
         requirement_id=requirement_id,
         update_data=update_data,
         actor="System",
     )
+    return ORJSONResponse(updated_req)
 
 @api_router.post("/requirements/relationships")
 async def create_relationship(relationship: RequirementRelationship):
-    # Add child to parent's child_ids
-    parent_result = await db.requirements.update_one(
-        {"id": relationship.parent_id},
-        {"$addToSet": {"child_ids": relationship.child_id}}
+    # Get requirement details for validation and logging
+    parent_req, child_req = await asyncio.gather(
+        db.requirements.find_one({"id": relationship.parent_id}, {"_id": 0, "req_id": 1}),
+        db.requirements.find_one({"id": relationship.child_id}, {"_id": 0, "req_id": 1}),
     )
+    if not parent_req or not child_req:
+        raise HTTPException(status_code=404, detail="One or both requirements not found")
     
-    # Add parent to child's parent_ids
-    child_result = await db.requirements.update_one(
-        {"id": relationship.child_id},
-        {"$addToSet": {"parent_ids": relationship.parent_id}}
+    # Add parent to child's parent_ids; the parent's child_ids is derived
+    now = _utcnow()
+    result = await db.requirements.update_one(
+        {"id": relationship.child_id, "parent_ids": {"$ne": relationship.parent_id}},
+        {"$addToSet": {"parent_ids": relationship.parent_id}, "$set": {"updated_at": now}}
     )
-    
-    if parent_result.modified_count == 0 or child_result.modified_count == 0:
+    if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="One or both requirements not found")
     
-    # Get requirement details for logging
-    parent_req = await db.requirements.find_one({"id": relationship.parent_id})
-    child_req = await db.requirements.find_one({"id": relationship.child_id})
-    
-    if parent_req and child_req:
-        # Log relationship creation for both requirements
-        await create_change_log_entry(
+    # Bump the parent for its new child_ids and log relationship creation
+    # for both requirements
+    await asyncio.gather(
+        touch_requirements([relationship.parent_id], now),
+        create_change_log_entry(
             requirement_id=relationship.parent_id,
             change_type="relationship_added",
             change_description=f"Child relationship added: {parent_req['req_id']} → {child_req['req_id']}"
-        )
-        
-        await create_change_log_entry(
+        ),
+        create_change_log_entry(
             requirement_id=relationship.child_id,
-            change_type="relationship_added", 
+            change_type="relationship_added",
             change_description=f"Parent relationship added: {parent_req['req_id']} → {child_req['req_id']}"
-        )
+        ),
+    )
     
     return {"message": "Relationship created"}
 
 @api_router.delete("/requirements/relationships/{parent_id}/{child_id}")
 async def delete_relationship(parent_id: str, child_id: str):
-    # Remove child from parent's child_ids
-    await db.requirements.update_one(
-        {"id": parent_id},
-        {"$pull": {"child_ids": child_id}}
+    # Remove parent from child's parent_ids (the parent's child_ids is
+    # derived) while fetching requirement details for logging
+    now = _utcnow()
+    result, parent_req, child_req = await asyncio.gather(
+        db.requirements.update_one(
+            {"id": child_id, "parent_ids": parent_id},
+            {"$pull": {"parent_ids": parent_id}, "$set": {"updated_at": now}}
+        ),
+        db.requirements.find_one({"id": parent_id}, {"_id": 0, "req_id": 1}),
+        db.requirements.find_one({"id": child_id}, {"_id": 0, "req_id": 1}),
     )
     
-    # Remove parent from child's parent_ids
-    await db.requirements.update_one(
-        {"id": child_id},
-        {"$pull": {"parent_ids": parent_id}}
-    )
-    
-    # Get requirement details for logging
-    parent_req = await db.requirements.find_one({"id": parent_id})
-    child_req = await db.requirements.find_one({"id": child_id})
-    
+    if result.modified_count:
+        # The parent's derived child_ids lost this child
+        await touch_requirements([parent_id], now)
+
     if parent_req and child_req:
         # Log relationship deletion for both requirements
-        await create_change_log_entry(
-            requirement_id=parent_id,
-            change_type="relationship_removed",
-            change_description=f"Child relationship removed: {parent_req['req_id']} → {child_req['req_id']}"
-        )
-        
-        await create_change_log_entry(
-            requirement_id=child_id,
-            change_type="relationship_removed",
-            change_description=f"Parent relationship removed: {parent_req['req_id']} → {child_req['req_id']}"
+        await asyncio.gather(
+            create_change_log_entry(
+                requirement_id=parent_id,
+                change_type="relationship_removed",
+                change_description=f"Child relationship removed: {parent_req['req_id']} → {child_req['req_id']}"
+            ),
+            create_change_log_entry(
+                requirement_id=child_id,
+                change_type="relationship_removed",
+                change_description=f"Parent relationship removed: {parent_req['req_id']} → {child_req['req_id']}"
+            ),
         )
     
     return {"message": "Relationship deleted"}
 
-@api_router.put("/requirements/batch")
-async def batch_update_requirements(payload: Dict[str, Any]):
-    """Batch update requirements by delegating to the shared update helper.
-
-    Expected JSON body:
-    {
-        "requirement_ids": ["id1", "id2", ...],
-        "update": { ... fields from RequirementUpdate ... }
-    }
-    """
-    requirement_ids = payload.get("requirement_ids") or []
-    update_raw = payload.get("update") or {}
-
-    if not requirement_ids:
-        raise HTTPException(status_code=400, detail="No requirement_ids provided")
-
-    # Build a RequirementUpdate model from the raw update dict
-    update_model = RequirementUpdate(**update_raw)
-
-    updated: List[Requirement] = []
-    failed: List[str] = []
-
-    for req_id in requirement_ids:
-        try:
-            updated_req = await update_requirement_with_logging(
-                requirement_id=req_id,
-                update_data=update_model,
-                actor="System(batch)",
-            )
-            updated.append(updated_req)
-        except HTTPException:
-            # If a requirement is not found or update fails, record it and continue
-            failed.append(req_id)
-
-    return {
-        "updated_count": len(updated),
-        "failed_ids": failed,
-        "updated_requirements": updated,
-    }
-
 @api_router.delete("/requirements/{requirement_id}")
 async def delete_requirement(requirement_id: str):
     """API endpoint wrapper around delete_requirement_with_logging"""
@@ -664,37 +982,56 @@ async def delete_requirement(requirement_id: str):
 # Dashboard statistics
 @api_router.get("/dashboard/stats")
 async def get_dashboard_stats(project_id: str):
-    # Total requirements count
-    total_requirements = await db.requirements.count_documents({"project_id": project_id})
-    
-    # Status distribution
-    status_pipeline = [
+    # Compute every statistic from a single pass over the project's
+    # requirements instead of one round-trip per figure
+    stats_pipeline = [
         {"$match": {"project_id": project_id}},
-        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+        {"$facet": {
+            "total": [{"$count": "count"}],
+            "status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            # Requirements with at least one child in this project, probed
+            # through the parent_ids index; dangling or cross-project
+            # parent_ids never match an existing requirement here
+            "with_children": [
+                {"$lookup": {
+                    "from": "requirements",
+                    "localField": "id",
+                    "foreignField": "parent_ids",
+                    "pipeline": [
+                        {"$match": {"project_id": project_id}},
+                        {"$limit": 1},
+                        {"$project": {"_id": 1}},
+                    ],
+                    "as": "first_child",
+                }},
+                {"$match": {"first_child.0": {"$exists": True}}},
+                {"$count": "count"},
+            ],
+            "with_verification": [
+                {"$match": {"verification_methods.0": {"$exists": True}}},
+                {"$count": "count"},
+            ],
+        }},
     ]
-    status_distribution = {}
-    async for doc in db.requirements.aggregate(status_pipeline):
-        status_distribution[doc["_id"]] = doc["count"]
+    (stats,) = await db.requirements.aggregate(stats_pipeline).to_list(1)
+
+    # $count emits no document for an empty input
+    total_requirements = stats["total"][0]["count"] if stats["total"] else 0
+    requirements_with_children = stats["with_children"][0]["count"] if stats["with_children"] else 0
+    requirements_with_verification = stats["with_verification"][0]["count"] if stats["with_verification"] else 0
+    status_distribution = {doc["_id"]: doc["count"] for doc in stats["status"]}
     
     # Calculate percentages
     status_percentages = {}
-    for status in RequirementStatus:
-        count = status_distribution.get(status.value, 0)
+    for status_value in _STATUS_VALUES:
+        count = status_distribution.get(status_value, 0)
         percentage = (count / total_requirements * 100) if total_requirements > 0 else 0
-        status_percentages[status.value] = round(percentage, 1)
+        status_percentages[status_value] = round(percentage, 1)
     
     # Children assignment percentage
-    requirements_with_children = await db.requirements.count_documents({
-        "project_id": project_id,
-        "child_ids.0": {"$exists": True}
-    })
     children_percentage = (requirements_with_children / total_requirements * 100) if total_requirements > 0 else 0
     
     # Verification methods percentage
-    requirements_with_verification = await db.requirements.count_documents({
-        "project_id": project_id,
-        "verification_methods.0": {"$exists": True}
-    })
     verification_percentage = (requirements_with_verification / total_requirements * 100) if total_requirements > 0 else 0
     
     return {
@@ -704,32 +1041,15 @@ async def get_dashboard_stats(project_id: str):
         "verification_methods_percentage": round(verification_percentage, 1)
     }
 
-# Search endpoint
-@api_router.get("/requirements/search")
-async def search_requirements(q: str, project_id: Optional[str] = None):
-    query = {
-        "$or": [
-            {"title": {"$regex": q, "$options": "i"}},
-            {"text": {"$regex": q, "$options": "i"}},
-            {"req_id": {"$regex": q, "$options": "i"}}
-        ]
-    }
-    
-    if project_id:
-        query["project_id"] = project_id
-    
-    requirements = await db.requirements.find(query).to_list(100)
-    return [Requirement(**parse_from_mongo(req)) for req in requirements]
-
 # Change log endpoint
-@api_router.get("/requirements/{requirement_id}/changelog", response_model=List[RequirementChangeLog])
+@api_router.get("/requirements/{requirement_id}/changelog")
 async def get_requirement_changelog(requirement_id: str):
     """Get the complete change history for a specific requirement"""
     change_logs = await db.requirement_change_logs.find(
-        {"requirement_id": requirement_id}
+        {"requirement_id": requirement_id}, {"_id": 0}
     ).sort("created_at", -1).to_list(1000)  # Sort by newest first
     
-    return [RequirementChangeLog(**parse_from_mongo(log)) for log in change_logs]
+    return ORJSONResponse(change_logs)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -749,6 +1069,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    """Ensure indexes backing every lookup, filter and sort the API issues.
+
+    Compound keys follow the equality-sort-range rule; ``id`` is the
+    canonical key for all collections, so it is unique everywhere.
+    """
+    # Fail fast on a bad connection and warm the pool before serving traffic
+    await client.admin.command("ping")
+
+    active_only = {"partialFilterExpression": {"is_active": True}}
+
+    await db.projects.create_indexes([
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("is_active", ASCENDING)], **active_only),
+    ])
+    await db.groups.create_indexes([
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("project_id", ASCENDING)]),
+        IndexModel([("is_active", ASCENDING)], **active_only),
+    ])
+    await db.chapters.create_indexes([
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("group_id", ASCENDING)]),
+    ])
+    await db.requirements.create_indexes([
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("project_id", ASCENDING), ("group_id", ASCENDING), ("chapter_id", ASCENDING)]),
+        IndexModel([("project_id", ASCENDING), ("status", ASCENDING)]),
+        IndexModel([("project_id", ASCENDING), ("updated_at", DESCENDING)]),
+        IndexModel([("group_id", ASCENDING)]),
+        IndexModel([("chapter_id", ASCENDING)]),
+        IndexModel([("project_id", ASCENDING), ("req_id", ASCENDING)]),
+        # Multikey; serves the child_ids lookup and unlinking on delete
+        IndexModel([("parent_ids", ASCENDING)]),
+        IndexModel([("title", TEXT), ("text", TEXT), ("req_id", TEXT)]),
+    ])
+    await db.requirement_change_logs.create_indexes([
+        IndexModel([("requirement_id", ASCENDING), ("created_at", DESCENDING)]),
+    ])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Production launch: uvloop event loop, httptools parser, one worker per
+    # CPU. Each worker imports this module and so builds its own Motor pool.
+    uvicorn.run(
+        "server:app",
+        host=os.environ.get('HOST', '0.0.0.0'),
+        port=int(os.environ.get('PORT', '8001')),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1)),
+    )
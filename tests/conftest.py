@@ -0,0 +1,84 @@
+"""Shared fixtures for the backend API tests.
+
+The API relies on aggregation features mongomock does not implement
+($lookup with both localField and pipeline, $setIntersection, $convert),
+so these tests run against a real MongoDB 5.0+ server given by MONGO_URL
+(default ``mongodb://localhost:27017``) and are skipped when none is
+reachable. They use their own database, TEST_DB_NAME (default
+``rmt_test``), which is dropped before and after the session.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+TEST_DB_NAME = os.environ.get("TEST_DB_NAME", "rmt_test")
+
+
+@pytest.fixture(scope="session")
+def mongo():
+    """Direct handle on the test database for seeding and inspection"""
+    mongo_url = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+    mongo_client = MongoClient(mongo_url, serverSelectionTimeoutMS=2000, tz_aware=True)
+    try:
+        version = mongo_client.server_info()["versionArray"]
+    except PyMongoError as exc:
+        pytest.skip(f"MongoDB not reachable at {mongo_url}: {exc}")
+    if version < [5, 0]:
+        pytest.skip("Derived child_ids need MongoDB 5.0+")
+
+    # server.py reads these at import time; set them before the client fixture
+    os.environ["MONGO_URL"] = mongo_url
+    os.environ["DB_NAME"] = TEST_DB_NAME
+
+    mongo_client.drop_database(TEST_DB_NAME)
+    yield mongo_client[TEST_DB_NAME]
+    mongo_client.drop_database(TEST_DB_NAME)
+    mongo_client.close()
+
+
+@pytest.fixture(scope="session")
+def client(mongo):
+    """TestClient over the app; entering it runs the startup hook (indexes)"""
+    sys.path.insert(0, str(BACKEND_DIR))
+    import server
+    from fastapi.testclient import TestClient
+
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def project(client):
+    """A fresh project with two groups, removed again after the test"""
+    project = client.post("/api/projects", json={"name": "Test project"}).json()
+    groups = [
+        client.post(
+            "/api/groups", json={"name": name, "project_id": project["id"]}
+        ).json()
+        for name in ("Group A", "Group B")
+    ]
+    yield {"id": project["id"], "group_ids": [group["id"] for group in groups]}
+    client.delete(f"/api/projects/{project['id']}")
+
+
+@pytest.fixture
+def make_requirement(client, project):
+    """Create a requirement in the test project through the API"""
+    def _make(group_index: int = 0, **fields):
+        payload = {
+            "title": "Requirement",
+            "text": "Requirement text",
+            "project_id": project["id"],
+            "group_id": project["group_ids"][group_index],
+            **fields,
+        }
+        response = client.post("/api/requirements", json=payload)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return _make
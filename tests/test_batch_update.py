@@ -0,0 +1,101 @@
+"""PUT /requirements/batch: validation, partial failures and change logs."""
+
+
+def batch_update(client, requirement_ids, update):
+    return client.put(
+        "/api/requirements/batch",
+        json={"requirement_ids": requirement_ids, "update": update},
+    )
+
+
+def update_logs(client, requirement_id):
+    logs = client.get(f"/api/requirements/{requirement_id}/changelog").json()
+    return [log for log in logs if log["change_type"] == "updated"]
+
+
+def test_unknown_status_is_rejected(client, make_requirement):
+    requirement = make_requirement()
+
+    response = batch_update(client, [requirement["id"]], {"status": "Shipped"})
+
+    assert response.status_code == 422
+    assert client.get(f"/api/requirements/{requirement['id']}").json()["status"] == "Draft"
+
+
+def test_empty_requirement_ids_is_rejected(client):
+    assert batch_update(client, [], {"status": "Tested"}).status_code == 400
+
+
+def test_unknown_ids_are_reported_as_failed(client, make_requirement):
+    first = make_requirement()
+    second = make_requirement()
+
+    response = batch_update(
+        client, [first["id"], "missing", second["id"], first["id"]], {"status": "Tested"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["updated_count"] == 2
+    assert body["failed_ids"] == ["missing"]
+    assert [r["id"] for r in body["updated_requirements"]] == [first["id"], second["id"]]
+    assert all(r["status"] == "Tested" for r in body["updated_requirements"])
+    for requirement in (first, second):
+        stored = client.get(f"/api/requirements/{requirement['id']}").json()
+        assert stored["status"] == "Tested"
+
+
+def test_fields_outside_update_model_are_ignored(client, project, make_requirement):
+    requirement = make_requirement()
+
+    response = batch_update(
+        client, [requirement["id"]], {"title": "Renamed", "project_id": "elsewhere", "req_id": "X"}
+    )
+
+    assert response.status_code == 200
+    stored = client.get(f"/api/requirements/{requirement['id']}").json()
+    assert stored["title"] == "Renamed"
+    assert stored["project_id"] == project["id"]
+    assert stored["req_id"] == requirement["req_id"]
+
+
+def test_change_log_entries_written_only_for_changed_fields(client, make_requirement):
+    changed = make_requirement(title="Old title")
+    unchanged = make_requirement(title="New title", status="Accepted")
+    before = client.get(f"/api/requirements/{unchanged['id']}").json()
+
+    response = batch_update(
+        client, [changed["id"], unchanged["id"]], {"title": "New title", "status": "Accepted"}
+    )
+    assert response.status_code == 200
+
+    logs = update_logs(client, changed["id"])
+    assert sorted(log["field_name"] for log in logs) == ["status", "title"]
+    assert all(log["changed_by"] == "System(batch)" for log in logs)
+    title_log = next(log for log in logs if log["field_name"] == "title")
+    assert (title_log["old_value"], title_log["new_value"]) == ("Old title", "New title")
+
+    assert update_logs(client, unchanged["id"]) == []
+    stored = client.get(f"/api/requirements/{unchanged['id']}").json()
+    assert stored["updated_at"] == before["updated_at"]
+
+
+def test_moving_parent_ids_refreshes_parents_in_other_group(client, project, make_requirement):
+    old_parent = make_requirement(group_index=0)
+    new_parent = make_requirement(group_index=0)
+    children = [
+        make_requirement(group_index=1, parent_ids=[old_parent["id"]]) for _ in range(2)
+    ]
+    params = {"project_id": project["id"], "group_id": project["group_ids"][0]}
+    etag = client.get("/api/requirements", params=params).headers["ETag"]
+
+    response = batch_update(
+        client, [child["id"] for child in children], {"parent_ids": [new_parent["id"]]}
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/requirements", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    child_ids = {r["id"]: sorted(r["child_ids"]) for r in response.json()}
+    assert child_ids[old_parent["id"]] == []
+    assert child_ids[new_parent["id"]] == sorted(child["id"] for child in children)
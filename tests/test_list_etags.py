@@ -0,0 +1,33 @@
+"""List ETags identify the representation, not just the matched rows."""
+
+
+def test_fields_selection_gets_its_own_etag(client, project, make_requirement):
+    make_requirement()
+    params = {"project_id": project["id"]}
+    full_etag = client.get("/api/requirements", params=params).headers["ETag"]
+
+    response = client.get(
+        "/api/requirements",
+        params={**params, "fields": "title"},
+        headers={"If-None-Match": full_etag},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != full_etag
+    assert set(response.json()[0]) == {"id", "title"}
+
+
+def test_searches_matching_the_same_rows_get_distinct_etags(client, project, make_requirement):
+    make_requirement()
+    params = {"project_id": project["id"]}
+    etag = client.get("/api/requirements/search", params={**params, "q": "REQ-0"}).headers["ETag"]
+
+    response = client.get(
+        "/api/requirements/search",
+        params={**params, "q": "REQ-00"},
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert [r["req_id"] for r in response.json()] == ["REQ-001"]
+    assert response.headers["ETag"] != etag
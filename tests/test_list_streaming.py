@@ -0,0 +1,42 @@
+"""Streamed JSON array list responses."""
+import uuid
+from datetime import datetime, timezone
+
+
+def test_list_spanning_several_batches_is_valid_json(client, mongo, project):
+    group_id = project["group_ids"][0]
+    now = datetime.now(timezone.utc)
+    mongo.chapters.insert_many([
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Chapter {order}",
+            "description": None,
+            "group_id": group_id,
+            "parent_id": None,
+            "order": order,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for order in range(250)
+    ])
+
+    response = client.get("/api/chapters", params={"group_id": group_id})
+
+    mongo.chapters.delete_many({"group_id": group_id})
+    assert response.status_code == 200
+    assert sorted(chapter["order"] for chapter in response.json()) == list(range(250))
+
+
+def test_query_failure_is_a_server_error(client, project, make_requirement, monkeypatch):
+    import server
+
+    make_requirement()
+    monkeypatch.setattr(
+        server, "requirement_read_stages", lambda projection: [{"$notAStage": {}}]
+    )
+    # Observe the response instead of re-raising the app's exception
+    monkeypatch.setattr(client._transport, "raise_server_exceptions", False)
+
+    response = client.get("/api/requirements", params={"project_id": project["id"]})
+
+    assert response.status_code == 500
@@ -0,0 +1,65 @@
+"""REQ-NNN allocation through the per-project counter."""
+import uuid
+from datetime import datetime, timezone
+
+
+def insert_legacy_requirements(mongo, project, req_ids):
+    """Store requirements created before counters existed, bypassing the API"""
+    now = datetime.now(timezone.utc)
+    mongo.requirements.insert_many([
+        {
+            "id": str(uuid.uuid4()),
+            "req_id": req_id,
+            "title": "Legacy",
+            "text": "Legacy text",
+            "status": "Draft",
+            "verification_methods": [],
+            "project_id": project["id"],
+            "group_id": project["group_ids"][0],
+            "parent_ids": [],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for req_id in req_ids
+    ])
+
+
+def test_numbering_starts_at_one(make_requirement):
+    assert [make_requirement()["req_id"] for _ in range(3)] == ["REQ-001", "REQ-002", "REQ-003"]
+
+
+def test_counter_is_seeded_from_existing_req_ids(mongo, project, make_requirement):
+    insert_legacy_requirements(mongo, project, ["REQ-007", "REQ-012", "REQ-3", "LEGACY"])
+    # Legacy rows may lack req_id entirely
+    mongo.requirements.update_one({"req_id": "LEGACY"}, {"$unset": {"req_id": ""}})
+    insert_legacy_requirements(mongo, project, [None])
+
+    assert make_requirement()["req_id"] == "REQ-013"
+    assert make_requirement()["req_id"] == "REQ-014"
+
+
+def test_deleted_numbers_are_not_reused(client, make_requirement):
+    make_requirement()
+    second = make_requirement()
+
+    assert client.delete(f"/api/requirements/{second['id']}").status_code == 200
+
+    assert make_requirement()["req_id"] == "REQ-003"
+
+
+def test_projects_are_numbered_independently(client, make_requirement):
+    make_requirement()
+    other_project = client.post("/api/projects", json={"name": "Other"}).json()
+    other_group = client.post(
+        "/api/groups", json={"name": "Other", "project_id": other_project["id"]}
+    ).json()
+
+    response = client.post("/api/requirements", json={
+        "title": "Other",
+        "text": "Other text",
+        "project_id": other_project["id"],
+        "group_id": other_group["id"],
+    })
+
+    client.delete(f"/api/projects/{other_project['id']}")
+    assert response.json()["req_id"] == "REQ-001"
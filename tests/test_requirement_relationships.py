@@ -0,0 +1,137 @@
+"""Derived child_ids and list ETags across relationship changes.
+
+child_ids is computed from other requirements' parent_ids, so a parent's
+list ETag must change whenever a child in any group links or unlinks it.
+"""
+
+
+def list_group(client, project, group_index, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(
+        "/api/requirements",
+        params={"project_id": project["id"], "group_id": project["group_ids"][group_index]},
+        headers=headers,
+    )
+
+
+def fresh_child_ids(client, project, etag, requirement_id):
+    """Revalidate group A with ``etag`` and return the requirement's child_ids"""
+    response = list_group(client, project, 0, etag)
+    assert response.status_code == 200, "stale ETag still matched"
+    (requirement,) = [r for r in response.json() if r["id"] == requirement_id]
+    return requirement["child_ids"], response.headers["ETag"]
+
+
+def test_unchanged_list_revalidates_with_304(client, project, make_requirement):
+    make_requirement()
+    etag = list_group(client, project, 0).headers["ETag"]
+
+    response = list_group(client, project, 0, etag)
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_creating_child_refreshes_parent_in_other_group(client, project, make_requirement):
+    parent = make_requirement(group_index=0)
+    etag = list_group(client, project, 0).headers["ETag"]
+
+    child = make_requirement(group_index=1, parent_ids=[parent["id"]])
+
+    child_ids, _ = fresh_child_ids(client, project, etag, parent["id"])
+    assert child_ids == [child["id"]]
+
+
+def test_relationship_changes_refresh_parent_in_other_group(client, project, make_requirement):
+    parent = make_requirement(group_index=0)
+    child = make_requirement(group_index=1)
+    etag = list_group(client, project, 0).headers["ETag"]
+
+    response = client.post(
+        "/api/requirements/relationships",
+        json={"parent_id": parent["id"], "child_id": child["id"]},
+    )
+    assert response.status_code == 200
+    child_ids, etag = fresh_child_ids(client, project, etag, parent["id"])
+    assert child_ids == [child["id"]]
+
+    response = client.delete(f"/api/requirements/relationships/{parent['id']}/{child['id']}")
+    assert response.status_code == 200
+    child_ids, _ = fresh_child_ids(client, project, etag, parent["id"])
+    assert child_ids == []
+
+
+def test_updating_parent_ids_refreshes_old_and_new_parents(client, project, make_requirement):
+    old_parent = make_requirement(group_index=0)
+    new_parent = make_requirement(group_index=0)
+    child = make_requirement(group_index=1, parent_ids=[old_parent["id"]])
+    etag = list_group(client, project, 0).headers["ETag"]
+
+    response = client.put(
+        f"/api/requirements/{child['id']}", json={"parent_ids": [new_parent["id"]]}
+    )
+    assert response.status_code == 200
+
+    response = list_group(client, project, 0, etag)
+    assert response.status_code == 200
+    child_ids = {r["id"]: r["child_ids"] for r in response.json()}
+    assert child_ids[old_parent["id"]] == []
+    assert child_ids[new_parent["id"]] == [child["id"]]
+
+
+def test_deleting_child_refreshes_parent(client, project, make_requirement):
+    parent = make_requirement(group_index=0)
+    child = make_requirement(group_index=1, parent_ids=[parent["id"]])
+    etag = list_group(client, project, 0).headers["ETag"]
+
+    assert client.delete(f"/api/requirements/{child['id']}").status_code == 200
+
+    child_ids, _ = fresh_child_ids(client, project, etag, parent["id"])
+    assert child_ids == []
+
+
+def test_deleting_childs_group_refreshes_parent(client, project, make_requirement):
+    parent = make_requirement(group_index=0)
+    make_requirement(group_index=1, parent_ids=[parent["id"]])
+    etag = list_group(client, project, 0).headers["ETag"]
+
+    assert client.delete(f"/api/groups/{project['group_ids'][1]}").status_code == 200
+
+    child_ids, _ = fresh_child_ids(client, project, etag, parent["id"])
+    assert child_ids == []
+
+
+def test_deleting_parent_unlinks_children(client, make_requirement):
+    parent = make_requirement(group_index=0)
+    child = make_requirement(group_index=1, parent_ids=[parent["id"]])
+
+    assert client.delete(f"/api/requirements/{parent['id']}").status_code == 200
+
+    assert client.get(f"/api/requirements/{child['id']}").json()["parent_ids"] == []
+
+
+def test_dashboard_ignores_dangling_and_cross_project_parents(client, project, make_requirement):
+    other_project = client.post("/api/projects", json={"name": "Other"}).json()
+    other_group = client.post(
+        "/api/groups", json={"name": "Other", "project_id": other_project["id"]}
+    ).json()
+    # Its only child lives in the other project
+    foreign_parent = make_requirement()
+    outsider = client.post("/api/requirements", json={
+        "title": "Outsider",
+        "text": "Outsider text",
+        "project_id": other_project["id"],
+        "group_id": other_group["id"],
+        "parent_ids": [foreign_parent["id"]],
+    }).json()
+
+    parent = make_requirement()
+    make_requirement(parent_ids=[parent["id"], "does-not-exist"])
+    make_requirement(parent_ids=[parent["id"], outsider["id"]])
+
+    stats = client.get("/api/dashboard/stats", params={"project_id": project["id"]}).json()
+
+    client.delete(f"/api/projects/{other_project['id']}")
+    assert stats["total_requirements"] == 4
+    # Only ``parent`` is an existing requirement of this project with children
+    assert stats["children_assignment_percentage"] == 25.0